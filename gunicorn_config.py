@@ -0,0 +1,17 @@
+"""Gunicorn settings used by `make run`: the master builds the parser
+before forking, so that workers share it instead of each building their
+own.
+
+The master then runs with the garbage collector disabled for its whole
+lifetime, and every worker (re)spawn freezes all objects it allocated
+so far; see ppp_natural_math.parser.preload()."""
+
+import ppp_natural_math
+
+preload_app = True
+
+def when_ready(server):
+    ppp_natural_math.preload()
+
+def pre_fork(server, worker):
+    ppp_natural_math.freeze()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Reports the unique RSS of each worker and the latency of its first
+request, with the module imported by the master before forking (like
+`gunicorn --preload`) and with each worker importing it by itself."""
+
+import os
+import sys
+import json
+import time
+import textwrap
+import traceback
+
+WORKERS = 4
+QUESTION = 'integral of f(x, y) from 0 to 1'
+
+def unique_rss():
+    """Returns the memory private to this process, in kB (Linux only)."""
+    total = 0
+    with open('/proc/self/smaps') as fd:
+        for line in fd:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                total += int(line.split()[1])
+    return total
+
+def worker(write_fd, done_fd):
+    """Answers a first request and reports on it; never returns."""
+    status = 1
+    try:
+        start = time.perf_counter()
+        from ppp_natural_math import parser
+        parser.translate(QUESTION)
+        latency = time.perf_counter() - start
+        report = {'rss': unique_rss(), 'latency': latency}
+        status = 0
+    except Exception:
+        report = {'error': traceback.format_exc()}
+    try:
+        os.write(write_fd, (json.dumps(report) + '\n').encode())
+        if status == 0:
+            # Stay alive until every sibling has measured itself, so
+            # that the pages they share are not counted as unique.
+            os.read(done_fd, 1)
+    finally:
+        os._exit(status)
+
+def master(preload):
+    """Forks the workers and returns their reports."""
+    if preload:
+        from ppp_natural_math import parser
+        parser.preload()
+    done_read_fd, done_write_fd = os.pipe()
+    workers = []
+    for _ in range(WORKERS):
+        if preload:
+            parser.freeze()
+        # One pipe per worker, so that long error reports do not get
+        # interleaved.
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.close(done_write_fd)
+            worker(write_fd, done_read_fd)
+        os.close(write_fd)
+        workers.append((pid, read_fd))
+    os.close(done_read_fd)
+    reports = []
+    for (pid, read_fd) in workers:
+        with os.fdopen(read_fd) as fd:
+            line = fd.readline()
+        reports.append(json.loads(line) if line else
+                {'error': 'Exited without reporting.\n'})
+    os.close(done_write_fd)
+    for (pid, _) in workers:
+        os.waitpid(pid, 0)
+    return reports
+
+def run(preload):
+    """Runs a master and prints its workers' reports; returns whether
+    they all succeeded."""
+    reports = master(preload)
+    print('%s preloading:' % ('With' if preload else 'Without'))
+    for (i, report) in enumerate(reports):
+        if 'error' in report:
+            print('    worker %d: failed:' % i)
+            print(textwrap.indent(report['error'], ' '*8), end='')
+        else:
+            print('    worker %d: unique RSS %6d kB, '
+                  'first request %7.2f ms' %
+                  (i, report['rss'], report['latency']*1000))
+    return not any('error' in report for report in reports)
+
+def main(): # pragma: no cover
+    success = True
+    for preload in (False, True):
+        # Each master runs in its own process, so that the module
+        # imported by one run does not leak into the other.
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                status = 0 if run(preload) else 1
+            except Exception:
+                traceback.print_exc()
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        (_, status) = os.waitpid(pid, 0)
+        success = success and status == 0
+    exit(0 if success else 1)
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,15 @@
 """Natural language processing for math questions for the Projet Pensées
-Profondes."""
+Profondes.
+
+Pre-fork servers can share the parser between their workers by calling
+preload() once in the master, after loading the application, and
+freeze() right before each fork; servers that do not fork through
+os.fork() must also call after_fork() in each worker. See
+gunicorn_config.py and uwsgi_app.py for examples."""
 
 from ppp_libmodule import HttpRequestHandler
 from .requesthandler import RequestHandler
+from .parser import preload, freeze, after_fork
 
 def app(environ, start_response):
     """Function called by the WSGI server."""
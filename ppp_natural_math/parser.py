@@ -1,3 +1,5 @@
+import gc
+import os
 from collections import namedtuple
 from ply import lex, yacc
 
@@ -460,3 +462,46 @@ def build_tree(s):
 
 def translate(s):
     return build_tree(s).output()
+
+###################################################
+# Pre-fork servers
+_preloaded = False
+
+def preload():
+    """Warms up the lexer and parser in a pre-fork master, and disables
+    the garbage collector there so that it does not free objects and
+    leave holes in the pages its workers will share.
+    The collector stays disabled in the master for the rest of its
+    lifetime, so reference cycles created there are never collected;
+    each worker re-enables it after the fork.
+    Call freeze() right before each fork."""
+    global _preloaded
+    build_tree('integral of f(x) from 0 to 1')
+    if hasattr(gc, 'freeze'):
+        gc.disable()
+        _preloaded = True
+
+def freeze():
+    """Moves every object tracked by the garbage collector out of its
+    reach, so that collections in a worker do not write to the pages it
+    shares with the master. Call it right before forking.
+    Every call also moves whatever the master allocated since the
+    previous one (e.g. when respawning a worker) to the permanent
+    generation, where it is never collected."""
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+def after_fork():
+    """Gives the current process its own lexer, so workers forked from
+    a preloaded master do not share its mutable state, and re-enables
+    the garbage collector preload() disabled in the master.
+    It runs automatically after os.fork(); servers forking outside of
+    Python (e.g. uWSGI) must call it in each worker."""
+    global lexer, _preloaded
+    lexer = lexer.clone()
+    if _preloaded:
+        gc.enable()
+        _preloaded = False
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=after_fork)
@@ -1,5 +1,8 @@
+import gc
+import os
 import unittest
 
+import ppp_natural_math.parser
 from ppp_natural_math.parser import *
 
 class ParserTestCase(unittest.TestCase):
@@ -87,3 +90,31 @@ class ParserTestCase(unittest.TestCase):
 
     def testApprox(self):
         self.assertTranslates('approximate 4/5', 'Approx(4/5)')
+
+    @unittest.skipUnless(hasattr(os, 'register_at_fork'),
+            'os.register_at_fork is not available')
+    def testFork(self):
+        preload()
+        self.addCleanup(gc.unfreeze)
+        self.addCleanup(gc.enable)
+        self.addCleanup(setattr, ppp_natural_math.parser, '_preloaded', False)
+        freeze()
+        old_lexer = ppp_natural_math.parser.lexer
+        (read_fd, write_fd) = os.pipe()
+        pid = os.fork()
+        if pid == 0: # pragma: no cover
+            try:
+                os.close(read_fd)
+                result = (ppp_natural_math.parser.lexer is not old_lexer,
+                          gc.isenabled(),
+                          translate('integral of x'))
+                os.write(write_fd, repr(result).encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as fd:
+            result = fd.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(result, repr((True, True, 'Integrate(x, x)')))
+        self.assertIs(ppp_natural_math.parser.lexer, old_lexer)
+        self.assertFalse(gc.isenabled())
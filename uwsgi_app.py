@@ -0,0 +1,19 @@
+"""uWSGI entry point, used by uwsgi.ini: the master loads this module
+before forking its workers (lazy-apps disabled), so that they share the
+parser instead of each building their own.
+
+uWSGI forks outside of Python, so the workers call after_fork()
+themselves. Workers respawned later do not freeze the master's new
+objects; see ppp_natural_math.parser.preload() for the caveats of
+running the master without garbage collection."""
+
+from uwsgidecorators import postfork
+
+import ppp_natural_math
+
+ppp_natural_math.preload()
+ppp_natural_math.freeze()
+
+postfork(ppp_natural_math.after_fork)
+
+app = ppp_natural_math.app